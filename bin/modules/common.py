@@ -6,16 +6,22 @@ Email: paul.t.oliver.design@gmail.com
 
 Network communications module for Salis simulator. This module allows for IPC
 between individual Salis organisms and different simulations via UDP sockets.
+Instructions sent and received by organisms are exchanged with Salis' own
+common buffers in bulk, once per cycle.
 """
 
 import json
 import os
+import select
 import socket
 
-from ctypes import c_int, c_uint8, CFUNCTYPE
+from ctypes import c_uint8, CFUNCTYPE
 
 
 class Common:
+	# We no longer install any functors, as Salis' own common buffers get
+	# used instead. These types are only kept so that the library header
+	# parser can map the 'Sender' and 'Receiver' typedefs.
 	SENDER_TYPE = CFUNCTYPE(None, c_uint8)
 	RECEIVER_TYPE = CFUNCTYPE(c_uint8)
 
@@ -27,39 +33,27 @@ class Common:
 		self.max_buffer_size = max_buffer_size
 		self.in_buffer = bytearray()
 		self.out_buffer = bytearray()
-		self.sources = []
+		self.sources = {}
 		self.targets = []
 
+		# Salis keeps its own common buffers, which we synchronize with ours
+		# once per cycle. The head of our input buffer always mirrors the
+		# contents of Salis' input buffer, so we keep track of how many
+		# instructions we've passed along.
+		self.__in_synced = 0
+		self.__out_drain = (c_uint8 * max_buffer_size)()
+		self.__in_recv = memoryview(bytearray(max_buffer_size))
+		self.__localhost = None
+
 		# Use a global client socket for all output operations.
 		self.__client = self.__get_socket()
 
-	def define_functors(self):
-		""" Define the C callbacks which we'll pass to the Salis simulator.
-		These simply push and pop instructions from the input and output
-		buffers whenever organisms call the SEND and RCVE instructions.
-		"""
-		def sender(inst):
-			if len(self.out_buffer) < self.max_buffer_size:
-				self.out_buffer.append(inst)
-
-		def receiver():
-			if len(self.in_buffer):
-				res = self.in_buffer[0]
-				self.in_buffer = self.in_buffer[1:]
-				return c_uint8(res)
-			else:
-				return c_uint8(0)
-
-		self.__sender = self.SENDER_TYPE(sender)
-		self.__receiver = self.RECEIVER_TYPE(receiver)
-		self.__sim.lib.sal_comm_set_sender(self.__sender)
-		self.__sim.lib.sal_comm_set_receiver(self.__receiver)
-
 	def add_source(self, address, port):
-		""" Create new input socket.
+		""" Create new input socket. Sources are keyed by the address/port pair
+		the socket got bound to.
 		"""
 		sock = self.__get_server(address, port)
-		self.sources.append(sock)
+		self.sources[sock.getsockname()] = sock
 
 	def add_target(self, address, port):
 		""" Create new output address/port tuple. We use global output socket
@@ -68,10 +62,12 @@ class Common:
 		self.targets.append((address, port))
 
 	def remove_source(self, address, port):
-		""" Remove an input socket.
+		""" Remove and close an input socket.
 		"""
-		source = (address, port)
-		self.sources = [s for s in self.sources if s.getsockname() != source]
+		sock = self.sources.pop((address, port), None)
+
+		if sock:
+			sock.close()
 
 	def remove_target(self, address, port):
 		""" Remove an output address/port pair.
@@ -82,14 +78,22 @@ class Common:
 	def link_to_self(self, port):
 		""" Create input and output links to 'localhost'.
 		"""
-		self.add_source(socket.gethostbyname(socket.gethostname()), port)
-		self.add_target(socket.gethostbyname(socket.gethostname()), port)
+		localhost = self.__get_localhost()
+		self.add_source(localhost, port)
+		self.add_target(localhost, port)
 
 	def cycle(self):
-		""" We push all data on the output buffer to all targets and clear it.
-		We withdraw incoming data from all source sockets and append it to the
-		input buffer.
+		""" We collect all instructions sent by organisms, push all data on
+		the output buffer to all targets and clear it. We withdraw incoming
+		data from all source sockets and append it to the input buffer, which
+		organisms may then receive from.
 		"""
+		# Skip all work while there's nothing to send, receive or synchronize.
+		if self.__is_idle():
+			return
+
+		self.__sync_out_buffer()
+
 		if len(self.out_buffer) and self.targets:
 			for target in self.targets:
 				self.__client.sendto(self.out_buffer, target)
@@ -97,15 +101,15 @@ class Common:
 			# Clear output buffer.
 			self.out_buffer = bytearray()
 
-		# Receive data and store on input buffer.
-		if len(self.in_buffer) < self.max_buffer_size:
-			for source in self.sources:
-				try:
-					self.in_buffer += source.recv(
-						self.max_buffer_size - len(self.in_buffer)
-					)
-				except socket.error:
-					pass
+		# Receive data and store on input buffer. We poll all sources at once
+		# and only read from those that actually have data waiting.
+		if self.sources and len(self.in_buffer) < self.max_buffer_size:
+			ready, _, _ = select.select(self.sources.values(), [], [], 0)
+
+			for source in ready:
+				self.__recv_from(source)
+
+		self.__sync_in_buffer()
 
 	def load_network_config(self, filename):
 		""" Load network configuration from a JSON file.
@@ -121,29 +125,30 @@ class Common:
 		for target in in_dict["targets"]:
 			self.add_target(*target)
 
-		for inst in in_dict["in_buffer"]:
-			self.in_buffer.append(self.__sim.handler.inst_dict[inst])
-
-		for inst in in_dict["out_buffer"]:
-			self.out_buffer.append(self.__sim.handler.inst_dict[inst])
+		# Buffers get stored as strings of instruction symbols.
+		self.in_buffer += self.__symbs_to_insts(in_dict["in_buffer"])
+		self.out_buffer += self.__symbs_to_insts(in_dict["out_buffer"])
 
 	def save_network_config(self, filename):
 		""" Save network configuration to a JSON file.
 		"""
+		# Organisms may have sent or received instructions since the last
+		# cycle, so bring our buffers up to date with Salis' first.
+		self.__sync_out_buffer()
+		self.__sync_in_buffer()
+
+		# Buffers get stored as strings of instruction symbols.
+		inst_to_symb = self.__sim.printer.inst_to_symb
 		out_dict = {
 			"max_buffer_size": self.max_buffer_size,
-			"in_buffer": "",
-			"out_buffer": "",
-			"sources": [s.getsockname() for s in self.sources],
+			"in_buffer": self.in_buffer.translate(inst_to_symb).decode("ascii"),
+			"out_buffer": self.out_buffer.translate(inst_to_symb).decode(
+				"ascii"
+			),
+			"sources": list(self.sources),
 			"targets": self.targets,
 		}
 
-		for byte in self.in_buffer:
-			out_dict["in_buffer"] += self.__sim.printer.inst_list[byte][1]
-
-		for byte in self.out_buffer:
-			out_dict["out_buffer"] += self.__sim.printer.inst_list[byte][1]
-
 		with open(os.path.join(self.__settings_path, filename), "w") as f:
 			json.dump(out_dict, f, indent="\t")
 
@@ -158,6 +163,93 @@ class Common:
 		self_path = os.path.dirname(__file__)
 		return os.path.join(self_path, "../network")
 
+	def __symbs_to_insts(self, symbs):
+		""" Translate a string of instruction symbols into instruction bytes.
+		"""
+		printer = self.__sim.printer
+		insts = symbs.encode("ascii").translate(printer.symb_to_inst)
+
+		if printer.INVALID_INST in insts:
+			raise ValueError("Invalid instruction symbol on network buffer")
+
+		return insts
+
+	def __is_idle(self):
+		""" Check whether there's no network work to be done. This is the case
+		when there are no sources to poll, and neither our buffers nor Salis'
+		output buffer hold any instructions. Without any targets, a full
+		output buffer never gets cleared, so there's no room left to sync
+		into and we may skip work as well.
+		"""
+		if self.sources or self.in_buffer:
+			return False
+
+		if not self.targets and len(self.out_buffer) >= self.max_buffer_size:
+			return True
+
+		return not (self.out_buffer or self.__sim.lib.sal_comm_get_out_count())
+
+	def __sync_out_buffer(self):
+		""" Move all instructions sent by organisms from Salis' output buffer
+		into our own, as long as it has room for them. Instructions that don't
+		fit remain in Salis until the next cycle.
+		"""
+		room = self.max_buffer_size - len(self.out_buffer)
+
+		if room > 0:
+			if len(self.__out_drain) < room:
+				self.__out_drain = (c_uint8 * room)()
+
+			count = self.__sim.lib.sal_comm_drain_out(self.__out_drain, room)
+			self.out_buffer += bytes(self.__out_drain[:count])
+
+	def __recv_from(self, source):
+		""" Receive data from a source socket and append it to the input
+		buffer. Data gets received into a pre-allocated buffer, so that no
+		intermediate objects get created.
+		"""
+		room = self.max_buffer_size - len(self.in_buffer)
+
+		if room > 0:
+			if len(self.__in_recv) < room:
+				self.__in_recv = memoryview(bytearray(room))
+
+			try:
+				count = source.recv_into(self.__in_recv, room)
+				self.in_buffer += self.__in_recv[:count]
+			except socket.error:
+				pass
+
+	def __sync_in_buffer(self):
+		""" Drop all instructions organisms have received since the last
+		synchronization from our input buffer, and pass along any new
+		instructions to Salis' input buffer.
+		"""
+		in_count = self.__in_synced
+
+		if in_count:
+			in_count = self.__sim.lib.sal_comm_get_in_count()
+			del self.in_buffer[:self.__in_synced - in_count]
+
+		pending = len(self.in_buffer) - in_count
+
+		if pending > 0:
+			c_buffer = (c_uint8 * pending).from_buffer_copy(
+				self.in_buffer, in_count
+			)
+			in_count += self.__sim.lib.sal_comm_fill_in(c_buffer, pending)
+
+		self.__in_synced = in_count
+
+	def __get_localhost(self):
+		""" Get the address of this host. We resolve it only once, as doing so
+		might block on a DNS lookup.
+		"""
+		if self.__localhost is None:
+			self.__localhost = socket.gethostbyname(socket.gethostname())
+
+		return self.__localhost
+
 	def __get_socket(self):
 		""" Generate a non-blocking UDP socket.
 		"""
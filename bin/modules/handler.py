@@ -23,11 +23,25 @@ be used with care.
 import curses
 import os
 import time
+from functools import partial
+
+from ctypes import c_uint8
 
 
 class Handler:
 	KEY_ESCAPE = 27
 	CYCLE_TIMEOUT = 0.1
+	CYCLE_BURST = 16
+	UINT32_MAX = (2 ** 32) - 1
+
+	# Number keys [1 to 0] cycle the simulation [2 ** ((n - 1) % 10] times.
+	DIGIT_FACTORS = {ord(str((i + 1) % 10)): 2 ** i for i in range(10)}
+
+	# Maximum amount of compiled 'exec' commands kept around for reuse.
+	EXEC_CACHE_SIZE = 128
+
+	# Maximum amount of translated genome files kept around for reuse.
+	GENOME_CACHE_SIZE = 32
 
 	def __init__(self, sim):
 		""" Handler constructor. Simply link this class to the main simulation
@@ -35,15 +49,20 @@ class Handler:
 		"""
 		self.__sim = sim
 		self.__printer = sim.printer
-		self.__min_commands = [
+		self.__min_commands = frozenset([
 			ord("M"),
 			ord(" "),
 			ord("X"),
 			curses.KEY_RESIZE,
 			self.KEY_ESCAPE,
-		]
+		])
 		self.inst_dict = self.__get_inst_dict()
+		self.__inst_symbols = frozenset(self.inst_dict)
 		self.console_history = []
+		self.__exec_cache = {}
+		self.__genome_cache = {}
+		self.__key_table = self.__get_key_table()
+		self.__cmd_table = self.__get_cmd_table()
 
 		# Set short delay for ESCAPE key (which is used to exit the simulator).
 		os.environ.setdefault("ESCDELAY", "25")
@@ -57,84 +76,12 @@ class Handler:
 		if self.__sim.minimal and cmd not in self.__min_commands:
 			return
 
-		if cmd == self.KEY_ESCAPE:
-			self.__on_quit([None], save=True)
-		elif cmd == ord("M"):
-			self.__printer.screen.clear()
-			self.__sim.minimal = not self.__sim.minimal
-		elif cmd == ord(" "):
-			self.__sim.toggle_state()
-		elif cmd == curses.KEY_LEFT:
-			self.__printer.flip_page(-1)
-		elif cmd == curses.KEY_RIGHT:
-			self.__printer.flip_page(1)
-		elif cmd == curses.KEY_DOWN:
-			self.__printer.scroll_main(-1)
-		elif cmd == curses.KEY_UP:
-			self.__printer.scroll_main(1)
-		elif cmd == curses.KEY_RESIZE:
-			self.__printer.on_resize()
-		elif cmd == ord("X"):
-			self.__printer.toggle_hex()
-		elif cmd == ord("x"):
-			self.__printer.world.zoom_out()
-		elif cmd == ord("z"):
-			self.__printer.world.zoom_in()
-		elif cmd == ord("a"):
-			self.__printer.world.pan_left()
-			self.__printer.proc_scroll_left()
-			self.__printer.comm_scroll_left()
-		elif cmd == ord("d"):
-			self.__printer.world.pan_right()
-			self.__printer.proc_scroll_right()
-			self.__printer.comm_scroll_right()
-		elif cmd == ord("s"):
-			self.__printer.world.pan_down()
-			self.__printer.proc_scroll_down()
-		elif cmd == ord("w"):
-			self.__printer.world.pan_up()
-			self.__printer.proc_scroll_up()
-		elif cmd == ord("S"):
-			self.__printer.world.pan_down(fast=True)
-			self.__printer.proc_scroll_down(fast=True)
-		elif cmd == ord("W"):
-			self.__printer.world.pan_up(fast=True)
-			self.__printer.proc_scroll_up(fast=True)
-		elif cmd == ord("Q"):
-			self.__printer.world.pan_reset()
-			self.__printer.proc_scroll_vertical_reset()
-		elif cmd == ord("A"):
-			self.__printer.world.pan_reset()
-			self.__printer.proc_scroll_horizontal_reset()
-			self.__printer.comm_scroll_horizontal_reset()
-		elif cmd == ord("o"):
-			self.__printer.proc_select_prev()
-		elif cmd == ord("p"):
-			self.__printer.proc_select_next()
-		elif cmd == ord("f"):
-			self.__printer.proc_select_first()
-		elif cmd == ord("l"):
-			self.__printer.proc_select_last()
-		elif cmd == ord("k"):
-			self.__printer.proc_scroll_to_selected()
-		elif cmd == ord("g"):
-			self.__printer.proc_toggle_gene_view()
-		elif cmd == ord("i"):
-			self.__printer.world.toggle_ip_view()
-		elif cmd == ord("\n"):
-			self.__printer.run_cursor()
-		elif cmd == ord("c"):
-			self.__printer.run_console()
-		else:
-			# Check for numeric input. Number keys [1 to 0] cycle the
-			# simulation [2 ** ((n - 1) % 10] times.
-			try:
-				if chr(cmd).isdigit():
-					factor = int(chr(cmd))
-					factor = int(2 ** ((factor - 1) % 10))
-					self.__cycle_sim(factor)
-			except ValueError:
-				pass
+		# Look up the received key on the key table. Keys with no registered
+		# action get ignored.
+		action = self.__key_table.get(cmd)
+
+		if action:
+			action()
 
 	def handle_console(self, command_raw):
 		""" Process console commands. We parse and check for input errors. Any
@@ -146,44 +93,10 @@ class Handler:
 
 			try:
 				# Handle both python and self-thrown exceptions.
-				if command[0] in ["q", "quit"]:
-					self.__on_quit(command, save=True)
-				elif command[0] in ["q!", "quit!"]:
-					self.__on_quit(command, save=False)
-				elif command[0] in ["i", "input"]:
-					self.__on_input(command)
-				elif command[0] in ["c", "compile"]:
-					self.__on_compile(command)
-				elif command[0] in ["n", "new"]:
-					self.__on_new(command)
-				elif command[0] in ["k", "kill"]:
-					self.__on_kill(command)
-				elif command[0] in ["e", "exec"]:
-					self.__on_exec(command)
-				elif command[0] in ["s", "scroll"]:
-					self.__on_scroll(command)
-				elif command[0] in ["p", "process"]:
-					self.__on_proc_select(command)
-				elif command[0] in ["r", "rename"]:
-					self.__on_rename(command)
-				elif command[0] in ["save"]:
-					self.__on_save(command)
-				elif command[0] in ["a", "auto"]:
-					self.__on_set_autosave(command)
-				elif command[0] in ["l", "link"]:
-					self.__on_link_to_self(command)
-				elif command[0] in ["source"]:
-					self.__on_add_source(command)
-				elif command[0] in ["target"]:
-					self.__on_add_target(command)
-				elif command[0] in ["rem_source"]:
-					self.__on_remove_source(command)
-				elif command[0] in ["rem_target"]:
-					self.__on_remove_target(command)
-				elif command[0] in ["net_load"]:
-					self.__on_network_load(command)
-				elif command[0] in ["net_save"]:
-					self.__on_network_save(command)
+				handler = self.__cmd_table.get(command[0])
+
+				if handler:
+					handler(command)
 				else:
 					# Raise if a non-existing command has been given.
 					self.__raise("Invalid command: '{}'".format(command[0]))
@@ -216,27 +129,154 @@ class Handler:
 
 	def __cycle_sim(self, factor):
 		""" Simply cycle Salis 'factor' number of times. Do not cycle for more
-		than a given amount of time.
+		than a given amount of time. Cycles get performed in bursts of up to
+		'CYCLE_BURST' cycles, so that the timeout gets checked regularly.
 		"""
-		time_max = time.time() + self.CYCLE_TIMEOUT
+		cycle = self.__sim.cycle
+		time_max = time.monotonic() + self.CYCLE_TIMEOUT
 
-		for _ in range(factor):
-			self.__sim.cycle()
+		while factor > 0:
+			factor -= cycle(min(factor, self.CYCLE_BURST))
 
-			if time.time() > time_max:
+			if time.monotonic() > time_max:
 				break
 
+	def __get_key_table(self):
+		""" Generate a dictionary associating each key code to the action it
+		triggers. Building it once lets us dispatch keystrokes with a single
+		lookup, instead of comparing against every known key.
+		"""
+		printer = self.__printer
+		world = self.__printer.world
+		key_table = {
+			self.KEY_ESCAPE: lambda: self.__on_quit([None], save=True),
+			ord("M"): self.__toggle_minimal,
+			ord(" "): self.__sim.toggle_state,
+			curses.KEY_LEFT: lambda: printer.flip_page(-1),
+			curses.KEY_RIGHT: lambda: printer.flip_page(1),
+			curses.KEY_DOWN: lambda: printer.scroll_main(-1),
+			curses.KEY_UP: lambda: printer.scroll_main(1),
+			curses.KEY_RESIZE: printer.on_resize,
+			ord("X"): printer.toggle_hex,
+			ord("x"): world.zoom_out,
+			ord("z"): world.zoom_in,
+			ord("a"): self.__scroll_left,
+			ord("d"): self.__scroll_right,
+			ord("s"): self.__scroll_down,
+			ord("w"): self.__scroll_up,
+			ord("S"): lambda: self.__scroll_down(fast=True),
+			ord("W"): lambda: self.__scroll_up(fast=True),
+			ord("Q"): self.__scroll_vertical_reset,
+			ord("A"): self.__scroll_horizontal_reset,
+			ord("o"): printer.proc_select_prev,
+			ord("p"): printer.proc_select_next,
+			ord("f"): printer.proc_select_first,
+			ord("l"): printer.proc_select_last,
+			ord("k"): printer.proc_scroll_to_selected,
+			ord("g"): printer.proc_toggle_gene_view,
+			ord("i"): world.toggle_ip_view,
+			ord("\n"): printer.run_cursor,
+			ord("c"): printer.run_console,
+		}
+
+		# Number keys cycle the simulation by their precomputed factors.
+		for key, factor in self.DIGIT_FACTORS.items():
+			key_table[key] = partial(self.__cycle_sim, factor)
+
+		return key_table
+
+	def __get_cmd_table(self):
+		""" Generate a dictionary associating each console command (and its
+		aliases) to its handler. Handlers receive the full, split command.
+		"""
+		cmd_table = {}
+		common = self.__sim.common
+		commands = [
+			(["q", "quit"], lambda cmd: self.__on_quit(cmd, save=True)),
+			(["q!", "quit!"], lambda cmd: self.__on_quit(cmd, save=False)),
+			(["i", "input"], self.__on_input),
+			(["c", "compile"], self.__on_compile),
+			(["n", "new"], self.__on_new),
+			(["k", "kill"], self.__on_kill),
+			(["e", "exec"], self.__on_exec),
+			(["s", "scroll"], self.__on_scroll),
+			(["p", "process"], self.__on_proc_select),
+			(["r", "rename"], self.__on_rename),
+			(["save"], self.__on_save),
+			(["a", "auto"], self.__on_set_autosave),
+			(["l", "link"], self.__on_link_to_self),
+			(["source"], self.__get_link_handler(common.add_source)),
+			(["target"], self.__get_link_handler(common.add_target)),
+			(["rem_source"], self.__get_link_handler(common.remove_source)),
+			(["rem_target"], self.__get_link_handler(common.remove_target)),
+			(["net_load"], self.__on_network_load),
+			(["net_save"], self.__on_network_save),
+		]
+
+		for aliases, handler in commands:
+			for alias in aliases:
+				cmd_table[alias] = handler
+
+		return cmd_table
+
+	def __get_link_handler(self, link_func):
+		""" Generate a console command handler that adds or removes a network
+		source or target through 'link_func'.
+		"""
+		return lambda cmd: self.__on_network_link(cmd, link_func)
+
+	def __toggle_minimal(self):
+		""" Toggle minimal mode on or off. Screen must be erased, as both
+		layouts don't overlap.
+		"""
+		self.__printer.screen.erase()
+		self.__sim.minimal = not self.__sim.minimal
+
+	def __scroll_left(self):
+		""" Pan WORLD or scroll PROCESS and COMMON pages to the left.
+		"""
+		self.__printer.world.pan_left()
+		self.__printer.proc_scroll_left()
+		self.__printer.comm_scroll_left()
+
+	def __scroll_right(self):
+		""" Pan WORLD or scroll PROCESS and COMMON pages to the right.
+		"""
+		self.__printer.world.pan_right()
+		self.__printer.proc_scroll_right()
+		self.__printer.comm_scroll_right()
+
+	def __scroll_down(self, fast=False):
+		""" Pan WORLD or scroll PROCESS page downward.
+		"""
+		self.__printer.world.pan_down(fast)
+		self.__printer.proc_scroll_down(fast)
+
+	def __scroll_up(self, fast=False):
+		""" Pan WORLD or scroll PROCESS page upward.
+		"""
+		self.__printer.world.pan_up(fast)
+		self.__printer.proc_scroll_up(fast)
+
+	def __scroll_vertical_reset(self):
+		""" Scroll WORLD and PROCESS pages back to the top.
+		"""
+		self.__printer.world.pan_reset()
+		self.__printer.proc_scroll_vertical_reset()
+
+	def __scroll_horizontal_reset(self):
+		""" Scroll WORLD, PROCESS and COMMON pages back to the left.
+		"""
+		self.__printer.world.pan_reset()
+		self.__printer.proc_scroll_horizontal_reset()
+		self.__printer.comm_scroll_horizontal_reset()
+
 	def __get_inst_dict(self):
 		""" Transform the instruction list of the printer module into a
 		dictionary that's more useful for genome compilation. Instruction
 		symbols are keys, values are the actual byte representation.
 		"""
-		inst_dict = {}
-
-		for i, inst in enumerate(self.__printer.inst_list):
-			inst_dict[inst[1]] = i
-
-		return inst_dict
+		return {inst[1]: i for i, inst in enumerate(self.__printer.inst_list)}
 
 	def __on_quit(self, command, save):
 		""" Exit simulation. We can choose whether to save the simulation into
@@ -246,35 +286,84 @@ class Handler:
 			self.__raise("Invalid parameters for '{}'".format(command[0]))
 
 		if save:
-			self.__sim.lib.sal_main_save(
-				self.__sim.save_file_path.encode("utf-8")
-			)
+			self.__sim.lib.sal_main_save(self.__sim.save_file_path_b)
 
 		self.__sim.exit()
 
-	def __write_genome(self, genome, address_list):
-		""" Write genome stream into a given list of memory addresses. All
+	def __translate_genome(self, genome):
+		""" Translate a (valid) genome stream into an array of instruction
+		bytes, ready to be written into memory. The whole stream gets
+		translated at once through the printer's symbol translation table.
+		"""
+		insts = genome.encode("ascii").translate(self.__printer.symb_to_inst)
+		return (c_uint8 * len(insts)).from_buffer_copy(insts)
+
+	def __write_genome(self, insts, address_list):
+		""" Write translated genome into a given list of memory addresses. All
 		addresses must be valid or an exception is thrown.
 		"""
-		# All addresses we will write to must be valid.
-		for base_addr in address_list:
-			address = int(base_addr, 0)
+		# All addresses we will write to must be valid. We parse each base
+		# address only once.
+		addresses = [int(base_addr, 0) for base_addr in address_list]
+
+		for address in addresses:
+			self.__check_block(address, len(insts))
+
+		# All looks well! Let's compile the genome into memory, one whole block
+		# per base address.
+		for address in addresses:
+			self.__sim.lib.sal_mem_set_inst_block(address, insts, len(insts))
+
+	def __check_block(self, address, size, free=False):
+		""" Check that a memory block lies within memory bounds and,
+		optionally, that none of its addresses are allocated. An exception is
+		thrown on the first offending address. We check whole blocks at once,
+		instead of querying Salis once per address.
+		"""
+		if address < 0:
+			valid_size = 0
+		else:
+			mem_size = self.__sim.lib.sal_mem_get_size()
+			valid_size = max(0, min(size, mem_size - address))
 
-			for _ in range(len(genome)):
-				if not self.__sim.lib.sal_mem_is_address_valid(address):
-					self.__raise("Address '{}' is invalid".format(address))
+		if free and valid_size:
+			allocated = self.__sim.lib.sal_mem_find_allocated(
+				address, valid_size
+			)
 
-				address += 1
+			if allocated != self.UINT32_MAX:
+				self.__raise("Address '{}' is allocated".format(allocated))
 
-		# All looks well! Let's compile the genome into memory.
-		for base_addr in address_list:
-			address = int(base_addr, 0)
+		if valid_size < size:
+			self.__raise("Address '{}' is invalid".format(
+				address + valid_size
+			))
 
-			for symbol in genome:
-				self.__sim.lib.sal_mem_set_inst(
-					address, self.inst_dict[symbol]
-				)
-				address += 1
+	def __get_exec_code(self, source):
+		""" Compile an executable string, reusing previously compiled code
+		objects when the same string gets executed again. When the cache is
+		full, the oldest entry gets evicted.
+		"""
+		code = self.__exec_cache.get(source)
+
+		if code is None:
+			code = compile(source, "<console>", "exec")
+
+			if len(self.__exec_cache) >= self.EXEC_CACHE_SIZE:
+				del self.__exec_cache[next(iter(self.__exec_cache))]
+
+			self.__exec_cache[source] = code
+
+		return code
+
+	def __get_invalid_symbol(self, stream):
+		""" Find the first character on a genome stream that's not an actual
+		instruction symbol. Returns None if all characters are valid.
+		"""
+		if self.__inst_symbols.issuperset(stream):
+			return None
+
+		return next(char for char in stream if char not in self.__inst_symbols)
 
 	def __on_input(self, command):
 		""" Compile organism from user typed input. Compilation can only occur
@@ -285,14 +374,15 @@ class Handler:
 			self.__raise("Invalid parameters for '{}'".format(command[0]))
 
 		# All characters in file must be actual instruction symbols.
-		for character in command[1]:
-			if character not in self.inst_dict:
-				self.__raise("Invalid symbol '{}' found on stream".format(
-					character
-				))
+		character = self.__get_invalid_symbol(command[1])
+
+		if character is not None:
+			self.__raise("Invalid symbol '{}' found on stream".format(
+				character
+			))
 
 		# All looks well, Let's write the genome into memory.
-		self.__write_genome(command[1], command[2:])
+		self.__write_genome(self.__translate_genome(command[1]), command[2:])
 
 	def __on_compile(self, command):
 		""" Compile organism from source genome file. Genomes must be placed on
@@ -303,9 +393,28 @@ class Handler:
 		if len(command) < 3:
 			self.__raise("Invalid parameters for '{}'".format(command[0]))
 
-		# Open genome file for compilation.
+		# Open genome file for compilation. Genome files that haven't changed
+		# since they were last compiled needn't be read and translated again.
 		gen_file = os.path.join(self.__sim.path, "genomes", command[1])
+		gen_stat = os.stat(gen_file)
+		gen_key = (gen_file, gen_stat.st_mtime_ns, gen_stat.st_size)
+		insts = self.__genome_cache.get(gen_key)
+
+		if insts is None:
+			insts = self.__read_genome(gen_file)
+
+			if len(self.__genome_cache) >= self.GENOME_CACHE_SIZE:
+				del self.__genome_cache[next(iter(self.__genome_cache))]
 
+			self.__genome_cache[gen_key] = insts
+
+		# All looks well, Let's write the genome into memory.
+		self.__write_genome(insts, command[2:])
+
+	def __read_genome(self, gen_file):
+		""" Read, validate and translate a genome file. An exception will be
+		thrown when the genome file is invalid.
+		"""
 		with open(gen_file, "r") as f:
 			genome = f.read().strip()
 
@@ -314,14 +423,14 @@ class Handler:
 			self.__raise("Newline detected on '{}'".format(gen_file))
 
 		# All characters in file must be actual instruction symbols.
-		for character in genome:
-			if character not in self.inst_dict:
-				self.__raise("Invalid symbol '{}' found on '{}'".format(
-					character, gen_file
-				))
+		character = self.__get_invalid_symbol(genome)
 
-		# All looks well, Let's write the genome into memory.
-		self.__write_genome(genome, command[2:])
+		if character is not None:
+			self.__raise("Invalid symbol '{}' found on '{}'".format(
+				character, gen_file
+			))
+
+		return self.__translate_genome(genome)
 
 	def __on_new(self, command):
 		""" Instantiate new organism of given size on given address. These
@@ -330,22 +439,16 @@ class Handler:
 		if len(command) < 3:
 			self.__raise("Invalid parameters for '{}'".format(command[0]))
 
-		# Check that all addresses we will allocate are free and valid.
-		for base_addr in command[2:]:
-			address = int(base_addr, 0)
-
-			for _ in range(int(command[1])):
-				if not self.__sim.lib.sal_mem_is_address_valid(address):
-					self.__raise("Address '{}' is invalid".format(address))
-				elif self.__sim.lib.sal_mem_is_allocated(address):
-					self.__raise("Address '{}' is allocated".format(address))
+		# Parse organism size and base addresses only once.
+		size = int(command[1], 0)
+		addresses = [int(base_addr, 0) for base_addr in command[2:]]
 
-				address += 1
+		# Check that all addresses we will allocate are free and valid.
+		for address in addresses:
+			self.__check_block(address, size, free=True)
 
 		# All looks well! Let's instantiate our new organism.
-		for base_addr in command[2:]:
-			address = int(base_addr, 0)
-			size = int(command[1], 0)
+		for address in addresses:
 			self.__sim.lib.sal_proc_create(address, size)
 
 	def __on_kill(self, command):
@@ -380,7 +483,7 @@ class Handler:
 		#     >>> exec output = self.__sim.lib.sal_mem_get_order()
 		#
 		output = {}
-		exec(" ".join(command[1:]), locals(), output)
+		exec(self.__get_exec_code(" ".join(command[1:])), locals(), output)
 		self.__sim.printer.screen.clear()
 		self.__sim.printer.print_page()
 
@@ -406,7 +509,7 @@ class Handler:
 			if self.__sim.lib.sal_mem_is_address_valid(target):
 				self.__printer.world.scroll_to(target)
 			else:
-				self.__raise("Address '{}' is invalid".format(address))
+				self.__raise("Address '{}' is invalid".format(target))
 		else:
 			self.__raise("'{}' must be called on PROCESS or WORLD page".format(
 				command[0])
@@ -441,7 +544,7 @@ class Handler:
 		if len(command) != 1:
 			self.__raise("Invalid parameters for '{}'".format(command[0]))
 
-		self.__sim.lib.sal_main_save(self.__sim.save_file_path.encode("utf-8"))
+		self.__sim.lib.sal_main_save(self.__sim.save_file_path_b)
 
 	def __on_set_autosave(self, command):
 		""" Set the simulation's auto save interval. Provide any integer
@@ -462,45 +565,16 @@ class Handler:
 		port = int(command[1])
 		self.__sim.common.link_to_self(int(command[1]))
 
-	def __on_add_source(self, command):
-		""" Add new network source.
-		"""
-		if len(command) != 3:
-			self.__raise("Invalid parameters for '{}'".format(command[0]))
-
-		address = command[1]
-		port = int(command[2])
-		self.__sim.common.add_source(address, port)
-
-	def __on_add_target(self, command):
-		""" Add new network target.
-		"""
-		if len(command) != 3:
-			self.__raise("Invalid parameters for '{}'".format(command[0]))
-
-		address = command[1]
-		port = int(command[2])
-		self.__sim.common.add_target(address, port)
-
-	def __on_remove_source(self, command):
-		""" Remove existing network source.
-		"""
-		if len(command) != 3:
-			self.__raise("Invalid parameters for '{}'".format(command[0]))
-
-		address = command[1]
-		port = int(command[2])
-		self.__sim.common.remove_source(address, port)
-
-	def __on_remove_target(self, command):
-		""" Remove existing network target.
+	def __on_network_link(self, command, link_func):
+		""" Add or remove a network source or target. 'link_func' is the
+		Common module method that performs the actual operation.
 		"""
 		if len(command) != 3:
 			self.__raise("Invalid parameters for '{}'".format(command[0]))
 
 		address = command[1]
 		port = int(command[2])
-		self.__sim.common.remove_target(address, port)
+		link_func(address, port)
 
 	def __on_network_load(self, command):
 		""" Load network settings from JSON file (located on network settings
@@ -12,15 +12,19 @@ format. It makes use of the curses library for terminal handling.
 import curses
 import curses.textpad
 import os
+import re
 from collections import OrderedDict
+from functools import partial
 
-from ctypes import c_uint32, cast, POINTER
+from ctypes import c_uint8, c_uint32, cast, POINTER
 
 from modules.world import World
 
 
 class Printer:
 	ESCAPE_KEY = 27
+	INVALID_INST = 0xff
+	UINT32_MAX = (2 ** 32) - 1
 
 	def __init__(self, sim):
 		""" Printer constructor. It takes care of starting up curses, defining
@@ -33,11 +37,19 @@ class Printer:
 		# other private elements that depend on them.
 		self.screen = self.__get_screen()
 		self.inst_list = self.__get_inst_list()
+		self.inst_to_symb, self.symb_to_inst = self.__get_inst_tables()
 		self.proc_elements = self.__get_proc_elements()
+		self.proc_element_index = self.__get_proc_element_index()
+		self.selected_proc_data = (c_uint32 * len(self.proc_elements))()
+		self.__inst_counts = (c_uint32 * len(self.inst_list))()
 
 		# We can now initialize all other privates.
 		self.__main = self.__get_main()
 		self.__pages = self.__get_pages()
+		self.__page_names = tuple(self.__pages)
+		self.__page_index = {
+			name: pidx for pidx, name in enumerate(self.__page_names)
+		}
 		self.__minimal = self.__get_minimal()
 		self.__main_scroll = 0
 		self.__proc_element_scroll = 0
@@ -50,7 +62,7 @@ class Printer:
 		self.size = self.screen.getmaxyx()
 		self.current_page = "MEMORY"
 		self.selected_proc = 0
-		self.selected_proc_data = (c_uint32 * len(self.proc_elements))()
+		self.__proc_table = (c_uint32 * 0)()
 		self.proc_list_scroll = 0
 		self.world = World(self, self.__sim)
 
@@ -88,9 +100,11 @@ class Printer:
 		self.__print_hex = not self.__print_hex
 
 	def on_resize(self):
-		""" Called whenever the terminal window gets resized.
+		""" Called whenever the terminal window gets resized. The terminal gets
+		fully repainted, as its contents can't be trusted anymore.
 		"""
 		self.size = self.screen.getmaxyx()
+		self.screen.clear()
 		self.scroll_main()
 		self.world.zoom_reset()
 
@@ -98,9 +112,9 @@ class Printer:
 		""" Change data page by given offset (i.e. '1' for next page or '-1'
 		for previous one).
 		"""
-		pidx = list(self.__pages.keys()).index(self.current_page)
-		pidx = (pidx + offset) % len(self.__pages)
-		self.current_page = list(self.__pages.keys())[pidx]
+		pidx = self.__page_index[self.current_page]
+		pidx = (pidx + offset) % len(self.__page_names)
+		self.current_page = self.__page_names[pidx]
 		self.scroll_main()
 
 	def scroll_main(self, offset=0):
@@ -108,9 +122,10 @@ class Printer:
 		the terminal window. This method gets called, with no offset, under
 		certain situations, like changing pages, just to make sure the screen
 		gets cleared and at least some of the data is always scrolled into
-		view.
+		view. We only erase the screen, so that curses redraws just the
+		characters that actually change, instead of the whole terminal.
 		"""
-		self.screen.clear()
+		self.screen.erase()
 		len_main = len(self.__main)
 		len_page = len(self.__pages[self.current_page])
 		max_scroll = (len_main + len_page + 5) - self.size[0]
@@ -258,7 +273,7 @@ class Printer:
 			self.proc_list_scroll = self.selected_proc
 		elif self.current_page == "WORLD":
 			if not self.__sim.lib.sal_proc_is_free(self.selected_proc):
-				index = self.proc_elements.index("mb1a")
+				index = self.proc_element_index["mb1a"]
 				address = self.selected_proc_data[index]
 				self.world.scroll_to(address)
 
@@ -362,16 +377,13 @@ class Printer:
 		# Finally, extract data from console and send to handler. Respond to
 		# any possible resize event here.
 		self.__sim.handler.handle_console(output)
-		self.screen.clear()
 		self.on_resize()
 
 	def show_console_error(self, message):
 		""" Shows Salis console error messages, if any. These messages might
 		contain actual python exception output.
 		"""
-		self.__print_line(self.size[0] - 1, ">>>", curses.color_pair(
-			self.__pair_error
-		) | curses.A_BOLD)
+		self.__print_line(self.size[0] - 1, ">>>", self.__attr_error)
 		self.screen.refresh()
 
 		# We also use a Textbox object, just so that execution gets halted
@@ -382,9 +394,7 @@ class Printer:
 		# Curses may raise an exception if printing on the edge of the screen;
 		# we can just ignore it.
 		try:
-			console.addstr(0, 0, message, curses.color_pair(
-				self.__pair_error
-			) | curses.A_BOLD)
+			console.addstr(0, 0, message, self.__attr_error)
 		except curses.error:
 			pass
 
@@ -394,7 +404,6 @@ class Printer:
 			return EXIT
 
 		textbox.edit(validator)
-		self.screen.clear()
 		self.on_resize()
 
 	def print_page(self):
@@ -406,17 +415,20 @@ class Printer:
 			self.__print_minimal()
 			return
 
-		# Update selected proc data if in WORLD view.
+		# Update selected proc data if in WORLD view, or instruction counts if
+		# in MEMORY view.
 		if self.current_page == "WORLD":
 			self.__sim.lib.sal_proc_get_proc_data(self.selected_proc, cast(
 				self.selected_proc_data, POINTER(c_uint32)
 			))
+		elif self.current_page == "MEMORY":
+			self.__sim.lib.sal_mem_get_inst_counts(cast(
+				self.__inst_counts, POINTER(c_uint32)
+			))
 
 		# Print MAIN simulation data.
 		self.__print_line(
-			1, "SALIS[{}]".format(self.__sim.args.file), curses.color_pair(
-				self.__pair_header
-			) | curses.A_BOLD
+			1, "SALIS[{}]".format(self.__sim.args.file), self.__attr_header
 		)
 		self.__print_widget(2, self.__main)
 
@@ -447,6 +459,14 @@ class Printer:
 		self.__pair_selected = self.get_color_pair(curses.COLOR_YELLOW)
 		self.__pair_error = self.get_color_pair(curses.COLOR_RED)
 
+		# We also keep the final attribute values of the pairs above, so that
+		# they don't have to be assembled each time a line gets printed.
+		self.__attr_header = (
+			curses.color_pair(self.__pair_header) | curses.A_BOLD
+		)
+		self.__attr_selected = curses.color_pair(self.__pair_selected)
+		self.__attr_error = curses.color_pair(self.__pair_error) | curses.A_BOLD
+
 	def __get_screen(self):
 		""" Prepare and return the main curses window. We also set a shorter
 		delay when responding to a pressed escape key.
@@ -475,19 +495,38 @@ class Printer:
 		using the keyword 'SALIS_INST' to identify an instruction definition,
 		so be careful not to use this keyword anywhere else on the headers.
 		"""
-		inst_list = []
 		inst_file = os.path.join(self.__sim.path, "../include/instset.h")
 
 		with open(inst_file, "r") as f:
-			lines = f.read().splitlines()
+			text = f.read()
+
+		# Each definition starts a line and is followed by a doc-comment
+		# beginning with the instruction symbol. Names are truncated to four
+		# characters.
+		return re.findall(
+			r"^\s*SALIS_INST\s+(\S{1,4})\S*\s+\S+\s+(\S+)", text, re.MULTILINE
+		)
+
+	def __get_inst_tables(self):
+		""" Generate a pair of 256 byte translation tables, mapping instruction
+		bytes to their symbols and vice versa. These allow us to translate
+		whole buffers via 'bytes.translate()'. Characters that aren't
+		instruction symbols get mapped to 'INVALID_INST'.
+		"""
+		insts = bytes(range(len(self.inst_list)))
+		symbs = "".join(inst[1] for inst in self.inst_list).encode("ascii")
+		symb_to_inst = bytearray([self.INVALID_INST] * 256)
+
+		for inst, symb in zip(insts, symbs):
+			symb_to_inst[symb] = inst
 
-		for line in lines:
-			if line and line.split()[0] == "SALIS_INST":
-				inst_name = line.split()[1][:4]
-				inst_symb = line.split()[3]
-				inst_list.append((inst_name, inst_symb))
+		return bytes.maketrans(insts, symbs), bytes(symb_to_inst)
 
-		return inst_list
+	def __get_proc_element_index(self):
+		""" Map each process element name to its position on the process data
+		array, so elements can be looked up by name in constant time.
+		"""
+		return {element: i for i, element in enumerate(self.proc_elements)}
 
 	def __get_proc_elements(self):
 		""" Parse process structure member variables from C header file named
@@ -499,20 +538,21 @@ class Printer:
 		proc_elem_file = os.path.join(self.__sim.path, "../include/process.h")
 
 		with open(proc_elem_file, "r") as f:
-			lines = f.read().splitlines()
+			text = f.read()
 
-		for line in lines:
-			if line and line.split()[0] == "SALIS_PROC_ELEMENT":
-				proc_elem_name = line.split()[2].split(";")[0]
+		proc_elem_names = re.findall(
+			r"^\s*SALIS_PROC_ELEMENT\s+\S+\s+([^;\s]+)", text, re.MULTILINE
+		)
 
-				if proc_elem_name == "stack[8]":
-					# The stack is a special member variable, an array. We
-					# translate it by returning a list of stack identifiers.
-					proc_elem_list += ["stack[{}]".format(i) for i in range(8)]
-				else:
-					# We can assume all other struct elements are single
-					# variables.
-					proc_elem_list.append(proc_elem_name)
+		for proc_elem_name in proc_elem_names:
+			if proc_elem_name == "stack[8]":
+				# The stack is a special member variable, an array. We
+				# translate it by returning a list of stack identifiers.
+				proc_elem_list += ["stack[{}]".format(i) for i in range(8)]
+			else:
+				# We can assume all other struct elements are single
+				# variables.
+				proc_elem_list.append(proc_elem_name)
 
 		return proc_elem_list
 
@@ -535,22 +575,29 @@ class Printer:
 		object.
 		"""
 		# The following comprehensions build up widgets to help up print sets
-		# of data elements. The use of nested lambdas is needed to receive
-		# updated values.
-		# Instruction counter widget:
-		inst_widget = [("e", inst[0], (lambda j: (
-			lambda: self.__sim.lib.sal_mem_get_inst_count(j)
-		))(i)) for i, inst in enumerate(self.inst_list)]
+		# of data elements. Arguments get bound with 'partial', so that each
+		# call receives updated values without going through extra Python
+		# frames.
+		# Instruction counter widget. All counts get copied from Salis at once
+		# on each frame, so we bind to the counts array's item getter.
+		inst_widget = [
+			("e", inst[0], partial(self.__inst_counts.__getitem__, i))
+			for i, inst in enumerate(self.inst_list)
+		]
 
 		# Evolver module state widget:
-		state_widget = [("e", "state[{}]".format(i), (lambda j: (
-			lambda: self.__sim.lib.sal_evo_get_state(j)
-		))(i)) for i in range(4)]
+		state_widget = [
+			("e", "state[{}]".format(i), partial(
+				self.__sim.lib.sal_evo_get_state, i
+			)) for i in range(4)
+		]
 
-		# Selected process state widget:
-		selected_widget = [("p", element, (lambda j: (
-			lambda: self.selected_proc_data[j]
-		))(i)) for i, element in enumerate(self.proc_elements)]
+		# Selected process state widget. The selected process data array gets
+		# updated in place, so we can bind to its item getter directly.
+		selected_widget = [
+			("p", element, partial(self.selected_proc_data.__getitem__, i))
+			for i, element in enumerate(self.proc_elements)
+		]
 
 		# With the help of the widgets above, we can declare the PAGES
 		# dictionary object.
@@ -605,8 +652,7 @@ class Printer:
 	def __print_header(self, ypos, line):
 		""" Print a bold header.
 		"""
-		header_attr = curses.A_BOLD | curses.color_pair(self.__pair_header)
-		self.__print_line(ypos, line, header_attr)
+		self.__print_line(ypos, line, self.__attr_header)
 
 	def __print_value(self, ypos, element, value, attr=curses.A_NORMAL):
 		""" Print a label:value pair.
@@ -629,7 +675,7 @@ class Printer:
 		if self.__sim.lib.sal_proc_is_free(self.selected_proc):
 			attr = curses.A_NORMAL
 		else:
-			attr = curses.color_pair(self.__pair_selected)
+			attr = self.__attr_selected
 
 		self.__print_value(ypos, element, value, attr)
 
@@ -662,114 +708,157 @@ class Printer:
 		else:
 			return x
 
+	def __fetch_proc_table(self, first, rows):
+		""" Retrieve a copy of up to 'rows' process states, starting at the
+		given ID, with a single call. The process table buffer grows as
+		needed. Returns the number of processes retrieved.
+		"""
+		proc_count = max(0, min(
+			rows, self.__sim.lib.sal_proc_get_capacity() - first
+		))
+		table_size = proc_count * len(self.proc_elements)
+
+		if len(self.__proc_table) < table_size:
+			self.__proc_table = (c_uint32 * table_size)()
+
+		if proc_count:
+			self.__sim.lib.sal_proc_get_proc_data_block(
+				first, proc_count, cast(self.__proc_table, POINTER(c_uint32))
+			)
+
+		return proc_count
+
 	def __print_proc_data_list(self):
 		""" Print list of process data elements in PROCESS page. We can toggle
 		between printing the data elements or the genomes by pressing the 'g'
 		key.
 		"""
+		# Header and rows all share the same format, which we assemble only
+		# once per frame.
+		row_format = " | ".join(["{:<10}"] + ["{:>10}"] * (
+			len(self.proc_elements) - self.__proc_element_scroll
+		))
+
 		# First, print the table header, by extracting element names from the
 		# previously generated proc element list.
 		ypos = len(self.__main) + len(self.__pages["PROCESS"]) + 5
-		header = " | ".join(["{:<10}".format("pidx")] + [
-			"{:>10}".format(element)
-			for element in self.proc_elements[self.__proc_element_scroll:]
-		])
+		header = row_format.format(
+			"pidx", *self.proc_elements[self.__proc_element_scroll:]
+		)
 		self.__clear_line(ypos)
 		self.__print_header(ypos, header)
 		ypos += 1
 		proc_id = self.proc_list_scroll
+		proc_elem_count = len(self.proc_elements)
+		proc_count = self.__fetch_proc_table(proc_id, self.size[0] - ypos)
 
 		# Lastly, iterate all lines and print as much process data as it fits.
 		# We can scroll the process data table using the 'wasd' keys.
-		while ypos < self.size[0]:
+		for row_idx in range(self.size[0] - ypos):
 			self.__clear_line(ypos)
 
-			if proc_id < self.__sim.lib.sal_proc_get_capacity():
+			if row_idx < proc_count:
 				if proc_id == self.selected_proc:
 					# Always highlight the selected process.
-					attr = curses.color_pair(self.__pair_selected)
+					attr = self.__attr_selected
 				else:
 					attr = curses.A_NORMAL
 
-				# Retrieve a copy of the selected process state and store it in
-				# a list object.
-				proc_data = (c_uint32 * len(self.proc_elements))()
-				self.__sim.lib.sal_proc_get_proc_data(proc_id, cast(
-					proc_data, POINTER(c_uint32))
-				)
-
 				# Lastly, assemble and print the next table row.
-				row = " | ".join(["{:<10}".format(self.__data_format(proc_id))] + [
-					"{:>10}".format(self.__data_format(element))
-					for element in proc_data[self.__proc_element_scroll:]
-				])
-				self.__print_line(ypos, row, attr)
+				row_start = row_idx * proc_elem_count
+				row_data = [proc_id] + self.__proc_table[
+					row_start + self.__proc_element_scroll:
+					row_start + proc_elem_count
+				]
+
+				if self.__print_hex:
+					row_data = map(hex, row_data)
+
+				self.__print_line(ypos, row_format.format(*row_data), attr)
 
 			proc_id += 1
 			ypos += 1
 
 	def __print_proc_gene_block(
-		self, ypos, gidx, xpos, mbs, mba, ip, sp, pair
+		self, ypos, gidx, xpos, mbs, mba, ip, sp, attr
 	):
 		""" Print a sub-set of a process genome. Namely, on of its two memory
 		blocks.
 		"""
-		while gidx < mbs and xpos < self.size[1]:
-			gaddr = mba + gidx
-
-			if gaddr == ip:
-				attr = curses.color_pair(self.world.pair_sel_ip)
-			elif gaddr == sp:
-				attr = curses.color_pair(self.world.pair_sel_sp)
-			else:
-				attr = curses.color_pair(pair)
-
-			# Retrieve instruction from memory and transform it to correct
-			# symbol.
-			inst = self.__sim.lib.sal_mem_get_inst(gaddr)
-			symb = self.inst_list[inst][1]
-
-			# Curses raises an exception each time we print on the screen's
-			# edge. We can just catch and ignore it.
-			try:
-				self.screen.addstr(ypos, xpos, symb, attr)
-			except curses.error:
-				pass
-
-			gidx += 1
-			xpos += 1
+		count = min(mbs - gidx, self.size[1] - xpos)
+
+		if count <= 0:
+			return xpos
+
+		# Retrieve all visible instructions from memory at once and transform
+		# them to their correct symbols.
+		base = mba + gidx
+		insts = (c_uint8 * count)()
+		self.__sim.lib.sal_mem_get_inst_block(base, insts, count)
+		symbs = bytes(insts).translate(self.inst_to_symb).decode("ascii")
+
+		# Cells holding the IP and SP get highlighted. IP takes precedence
+		# when both point to the same cell.
+		marks = {}
+
+		for addr, mark in [
+			(sp, self.world.attr_sel_sp), (ip, self.world.attr_sel_ip)
+		]:
+			if base <= addr < base + count:
+				marks[addr - base] = mark
+
+		# Print the block as runs of same colored cells, split by the
+		# highlighted cells.
+		start = 0
+
+		for offset in sorted(marks):
+			self.__print_gene_run(ypos, xpos + start, symbs[start:offset], attr)
+			self.__print_gene_run(
+				ypos, xpos + offset, symbs[offset], marks[offset]
+			)
+			start = offset + 1
 
-		return xpos
+		self.__print_gene_run(ypos, xpos + start, symbs[start:], attr)
+		return xpos + count
 
-	def __print_proc_gene(self, ypos, proc_id):
-		""" Print a single process genome on the genome table. We use the same
-		colors to represent memory blocks, IP and SP of each process, as those
-		used to represent the selected process on WORLD view.
+	def __print_gene_run(self, ypos, xpos, symbs, attr):
+		""" Print a run of genome symbols sharing the same attributes.
 		"""
-		# There's nothing to print if process is free.
-		if self.__sim.lib.sal_proc_is_free(proc_id):
+		if not symbs:
 			return
 
-		# Process is alive. Retrieve a copy of the current process state and
-		# store it in a list object.
-		proc_data = (c_uint32 * len(self.proc_elements))()
-		self.__sim.lib.sal_proc_get_proc_data(proc_id, cast(
-			proc_data, POINTER(c_uint32))
-		)
+		# Curses raises an exception each time we print on the screen's
+		# edge. We can just catch and ignore it.
+		try:
+			self.screen.addstr(ypos, xpos, symbs, attr)
+		except curses.error:
+			pass
 
+	def __print_proc_gene(self, ypos, row_start):
+		""" Print a single process genome on the genome table. Process data
+		gets read from the process table, starting at the given offset. We use
+		the same colors to represent memory blocks, IP and SP of each process,
+		as those used to represent the selected process on WORLD view.
+		"""
 		# Let's extract all data of interest.
-		mb1a = proc_data[self.proc_elements.index("mb1a")]
-		mb1s = proc_data[self.proc_elements.index("mb1s")]
-		mb2a = proc_data[self.proc_elements.index("mb2a")]
-		mb2s = proc_data[self.proc_elements.index("mb2s")]
-		ip = proc_data[self.proc_elements.index("ip")]
-		sp = proc_data[self.proc_elements.index("sp")]
+		proc_table = self.__proc_table
+		mb1a = proc_table[row_start + self.proc_element_index["mb1a"]]
+		mb1s = proc_table[row_start + self.proc_element_index["mb1s"]]
+		mb2a = proc_table[row_start + self.proc_element_index["mb2a"]]
+		mb2s = proc_table[row_start + self.proc_element_index["mb2s"]]
+		ip = proc_table[row_start + self.proc_element_index["ip"]]
+		sp = proc_table[row_start + self.proc_element_index["sp"]]
+
+		# There's nothing to print if process is free, as free processes own
+		# no memory.
+		if not mb1s:
+			return
 
 		# Always print MAIN memory block (mb1) first (on the left side). That
 		# way we can keep most of our attention on the parent.
 		xpos = self.__print_proc_gene_block(
 			ypos, self.__proc_gene_scroll, 14, mb1s, mb1a, ip, sp,
-			self.world.pair_sel_mb1
+			self.world.attr_sel_mb1
 		)
 
 		# Reset gene counter and print child memory block, if it exists.
@@ -779,7 +868,7 @@ class Printer:
 			gidx = 0
 
 		self.__print_proc_gene_block(
-			ypos, gidx, xpos, mb2s, mb2a, ip, sp, self.world.pair_sel_mb2
+			ypos, gidx, xpos, mb2s, mb2a, ip, sp, self.world.attr_sel_mb2
 		)
 
 	def __print_proc_gene_list(self):
@@ -798,23 +887,26 @@ class Printer:
 		self.__print_header(ypos, header)
 		ypos += 1
 		proc_id = self.proc_list_scroll
+		proc_count = self.__fetch_proc_table(proc_id, self.size[0] - ypos)
 
 		# Iterate all lines and print as much genetic data as it fits. We can
 		# scroll the gene data table using the 'wasd' keys.
-		while ypos < self.size[0]:
+		for row_idx in range(self.size[0] - ypos):
 			self.__clear_line(ypos)
 
-			if proc_id < self.__sim.lib.sal_proc_get_capacity():
+			if row_idx < proc_count:
 				if proc_id == self.selected_proc:
 					# Always highlight the selected process.
-					attr = curses.color_pair(self.__pair_selected)
+					attr = self.__attr_selected
 				else:
 					attr = curses.A_NORMAL
 
 				# Assemble and print the next table row.
 				row = "{:<10} |".format(self.__data_format(proc_id))
 				self.__print_line(ypos, row, attr)
-				self.__print_proc_gene(ypos, proc_id)
+				self.__print_proc_gene(
+					ypos, row_idx * len(self.proc_elements)
+				)
 
 			proc_id += 1
 			ypos += 1
@@ -830,35 +922,28 @@ class Printer:
 			self.__print_line(ypos, "---")
 			return
 
-		xpos = 1
+		# Translate the visible part of the buffer into symbols all at once.
 		bpos = self.__common_buffer_scroll
+		visible = buff[bpos:bpos + self.size[1] - 2]
 		self.__clear_line(ypos)
-
-		while xpos < self.size[1] - 1 and bpos < len(buff):
-			symbol = self.inst_list[int(buff[bpos])][1]
-			self.screen.addstr(ypos, xpos, symbol)
-			xpos += 1
-			bpos += 1
+		self.screen.addstr(
+			ypos, 1, visible.translate(self.inst_to_symb).decode("ascii")
+		)
 
 	def __print_common_widget(
-		self, ypos_s, ypos_b, head_s, head_b, sockets, buff, sources=False
+		self, ypos_s, ypos_b, head_s, head_b, sockets, buff
 	):
 		""" Print data pertaining input or output network buffers, sources and
 		targets.
 		"""
 		self.__print_header(ypos_s, head_s)
 
-		# Socket info is stored differently for input and output.
-		if sources:
-			fmt_sock = lambda s: "{} {}".format(*s.getsockname())
-		else:
-			fmt_sock = lambda s: "{} {}".format(*s)
-
-		# Print active socket list.
+		# Print active socket list. Both sources and targets are identified by
+		# their address/port pairs.
 		if sockets:
 			for socket in sockets:
 				ypos_s += 1
-				self.__print_line(ypos_s, fmt_sock(socket))
+				self.__print_line(ypos_s, "{} {}".format(*socket))
 		else:
 			self.__print_line(ypos_s + 1, "---")
 
@@ -884,7 +969,6 @@ class Printer:
 			"IN BUFFER",
 			self.__sim.common.sources,
 			self.__sim.common.in_buffer,
-			sources=True,
 		)
 		self.__print_common_widget(
 			ypos_tgt,
@@ -916,26 +1000,13 @@ class Printer:
 			((ypos * line_size) + xpos) * self.world.zoom
 		)
 
-		# Now, iterate all living processes and try to find one that owns the
-		# calculated address.
+		# Now, ask Salis for the living process that owns the calculated
+		# address, if any.
 		if self.__sim.lib.sal_mem_is_address_valid(address):
-			for proc_id in range(self.__sim.lib.sal_proc_get_capacity()):
-				if not self.__sim.lib.sal_proc_is_free(proc_id):
-					proc_data = (c_uint32 * len(self.proc_elements))()
-					self.__sim.lib.sal_proc_get_proc_data(proc_id, cast(
-						proc_data, POINTER(c_uint32))
-					)
-					mb1a = proc_data[self.proc_elements.index("mb1a")]
-					mb1s = proc_data[self.proc_elements.index("mb1s")]
-					mb2a = proc_data[self.proc_elements.index("mb2a")]
-					mb2s = proc_data[self.proc_elements.index("mb2s")]
-
-					if (
-						mb1a <= address < (mb1a + mb1s) or
-						mb2a <= address < (mb2a + mb2s)
-					):
-						self.selected_proc = proc_id
-						break
+			proc_id = self.__sim.lib.sal_proc_get_owner_of(address)
+
+			if proc_id != self.UINT32_MAX:
+				self.selected_proc = proc_id
 
 	def __get_minimal(self):
 		""" Generate set of data fields to be printed on minimal mode.
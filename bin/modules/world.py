@@ -11,12 +11,20 @@ rendering parameters (position and zoom).
 """
 
 import curses
+import re
 
 from ctypes import c_uint8, cast, POINTER
 
 
 class World:
 	PADDING = 25
+	CODE_FREE = 0
+	CODE_ALLOC = 1
+	CODE_MBSTART = 2
+	CODE_IP = 3
+	CODE_SEL = {"mb2": 4, "mb1": 5, "sp": 6, "ip": 7}
+	CODE_BLANK = 8
+	RUN_PATTERN = re.compile(rb"(.)\1*", re.DOTALL)
 
 	def __init__(self, printer, sim):
 		""" World constructor. We link to the printer and main simulation
@@ -25,7 +33,11 @@ class World:
 		self.__printer = printer
 		self.__sim = sim
 		self.__set_world_colors()
+		self.__attrs = self.__get_attrs()
+		self.__code_tables = self.__get_code_tables()
+		self.__symb_tables = self.__get_symb_tables()
 		self.__show_ip = True
+		self.__image = (c_uint8 * 0)()
 		self.pos = 0
 		self.zoom = 1
 
@@ -38,50 +50,72 @@ class World:
 		if self.__printer.size[1] <= self.PADDING:
 			return
 
-		# Get pre-rendered image from Salis' memory module.
+		# Get pre-rendered image from Salis' memory module. The image buffer
+		# only gets reallocated when the printable area grows.
 		line_width = self.__printer.size[1] - self.PADDING
 		print_area = self.__printer.size[0] * line_width
-		c_buffer = (c_uint8 * print_area)()
+
+		if len(self.__image) < print_area:
+			self.__image = (c_uint8 * print_area)()
+
 		self.__sim.lib.sal_ren_get_image(
-			self.pos, self.zoom, print_area, cast(c_buffer, POINTER(c_uint8))
+			self.pos, self.zoom, print_area,
+			cast(self.__image, POINTER(c_uint8))
 		)
 
-		# Get data elements of selected process, if it's running, and store
-		# them into a convenient dict object.
-		if self.__sim.lib.sal_proc_is_free(self.__printer.selected_proc):
-			sel_data = None
-		else:
+		# Translate the whole image into cell symbols and into color codes,
+		# which index the world's attribute list. Both come from tables
+		# indexed by the rendered cell bytes.
+		image = bytes(memoryview(self.__image)[:print_area])
+		symbs = bytearray(image.translate(self.__symb_tables[self.zoom == 1]))
+		codes = bytearray(image.translate(self.__code_tables[self.__show_ip]))
+
+		# Overlay the selected process' state, if it's running. Later overlays
+		# take precedence, so IP gets painted last.
+		if not self.__sim.lib.sal_proc_is_free(self.__printer.selected_proc):
 			out_data = self.__printer.selected_proc_data
-			out_elem = self.__printer.proc_elements
-			sel_data = {
-				"ip": out_data[out_elem.index("ip")],
-				"sp": out_data[out_elem.index("sp")],
-				"mb1a": out_data[out_elem.index("mb1a")],
-				"mb1s": out_data[out_elem.index("mb1s")],
-				"mb2a": out_data[out_elem.index("mb2a")],
-				"mb2s": out_data[out_elem.index("mb2s")],
-			}
-
-		# Iterate all cells on printable area and print the post-rendered
-		# cells. Rendered cells contain info about bit flags and instructions
-		# currently written into memory.
-		bidx = 0
+			out_elem = self.__printer.proc_element_index
+
+			for block in ["mb2", "mb1"]:
+				self.__paint_block(
+					codes, self.CODE_SEL[block],
+					out_data[out_elem[block + "a"]],
+					out_data[out_elem[block + "s"]],
+				)
+
+			for ptr in ["sp", "ip"]:
+				self.__paint_block(
+					codes, self.CODE_SEL[ptr], out_data[out_elem[ptr]], 1
+				)
+
+		# Paint black all cells that are out of memory bounds.
+		mem_size = self.__sim.lib.sal_mem_get_size()
+		valid = max(0, min(print_area, -(-(mem_size - self.pos) // self.zoom)))
+		symbs[valid:] = b" " * (print_area - valid)
+		codes[valid:] = bytes([self.CODE_BLANK]) * (print_area - valid)
+		symbs = symbs.decode("ascii")
+
+		# Print each line as runs of cells sharing the same color. Curses
+		# raises an exception when printing on the edge of the screen; we can
+		# just ignore it.
+		addstr = self.__printer.screen.addstr
 
 		for y in range(self.__printer.size[0]):
-			for x in range(line_width):
-				xpad = x + self.PADDING
-				addr = self.pos + (self.zoom * bidx)
-				symb, attr = self.__render_cell(c_buffer[bidx], addr, sel_data)
+			line_start = y * line_width
+			line_codes = codes[line_start:line_start + line_width]
+
+			for run in self.RUN_PATTERN.finditer(line_codes):
+				start, end = run.span()
 
-				# Curses raises an exception when printing on the edge of the
-				# screen; we can just ignore it.
 				try:
-					self.__printer.screen.addstr(y, xpad, symb, attr)
+					addstr(
+						y, start + self.PADDING,
+						symbs[line_start + start:line_start + end],
+						self.__attrs[line_codes[start]]
+					)
 				except curses.error:
 					pass
 
-				bidx += 1
-
 	def zoom_out(self):
 		""" Zoom out by a factor of 2 (zoom *= 2).
 		"""
@@ -190,72 +224,93 @@ class World:
 			 curses.COLOR_BLACK, curses.COLOR_RED
 		)
 
-	def __render_cell(self, byte, addr, sel_data=None):
-		""" Render a single cell on the WORLD view. All cells are rendered by
-		interpreting the values coming in from the buffer. We overlay special
-		colors for representing the selected organism's state, on top of the
-		more common colors used to represent memory state.
-		"""
-		# Paint black all cells that are out of memory bounds.
-		if not self.__sim.lib.sal_mem_is_address_valid(addr):
-			return " ", curses.A_NORMAL
-
-		# Check if cell contains part of the currently selected process.
-		if sel_data:
-			top_addr = addr + self.zoom
-			top_mb1a = sel_data["mb1a"] + sel_data["mb1s"]
-			top_mb2a = sel_data["mb2a"] + sel_data["mb2s"]
-
-			if addr <= sel_data["ip"] < top_addr:
-				pair = self.pair_sel_ip
-			elif addr <= sel_data["sp"] < top_addr:
-				pair = self.pair_sel_sp
-			elif top_addr > sel_data["mb1a"] and top_mb1a > addr:
-				pair = self.pair_sel_mb1
-			elif top_addr > sel_data["mb2a"] and top_mb2a > addr:
-				pair = self.pair_sel_mb2
-
-		# No pair has been selected yet; select pair based on bit-flags.
-		if not "pair" in locals():
-			if self.__show_ip and byte >= 0x80:
-				pair = self.pair_ip
-			elif (byte % 0x80) >= 0x40:
-				pair = self.pair_mbstart
-			elif (byte % 0x40) >= 0x20:
-				pair = self.pair_alloc
-			else:
-				pair = self.pair_free
+		# The printer's gene view reuses the selected process colors, so we
+		# keep their final attribute values as well.
+		self.attr_sel_mb2 = curses.color_pair(self.pair_sel_mb2)
+		self.attr_sel_mb1 = curses.color_pair(self.pair_sel_mb1)
+		self.attr_sel_sp = curses.color_pair(self.pair_sel_sp)
+		self.attr_sel_ip = curses.color_pair(self.pair_sel_ip)
 
-		# Select symbol to represent instructions currently on cell.
-		inst = byte % 32
+	def __get_attrs(self):
+		""" List curses attributes of all colors used on the world, indexed by
+		color code.
+		"""
+		return [curses.color_pair(pair) for pair in [
+			self.pair_free,
+			self.pair_alloc,
+			self.pair_mbstart,
+			self.pair_ip,
+			self.pair_sel_mb2,
+			self.pair_sel_mb1,
+			self.pair_sel_sp,
+			self.pair_sel_ip,
+		]] + [curses.A_NORMAL]
+
+	def __get_code_tables(self):
+		""" Generate 256 byte translation tables mapping rendered cell bytes
+		to color codes, based on the bit-flags set on each cell. The first
+		table ignores the IP flag, as IPs can be hidden from view.
+		"""
+		tables = []
+
+		for show_ip in [False, True]:
+			table = bytearray(256)
+
+			for byte in range(256):
+				if show_ip and byte >= 0x80:
+					table[byte] = self.CODE_IP
+				elif (byte % 0x80) >= 0x40:
+					table[byte] = self.CODE_MBSTART
+				elif (byte % 0x40) >= 0x20:
+					table[byte] = self.CODE_ALLOC
+				else:
+					table[byte] = self.CODE_FREE
+
+			tables.append(bytes(table))
+
+		return tables
+
+	def __get_symb_tables(self):
+		""" Generate 256 byte translation tables mapping rendered cell bytes
+		to their symbols. When zoomed out, cells hold the average of many
+		instructions, so they just get represented as either '.' or ':'. The
+		second table is used when not zoomed out and shows the actual
+		instruction symbols.
+		"""
+		zoomed = bytes(
+			ord(":") if (byte % 32) > 16 else ord(".") for byte in range(256)
+		)
+		actual = bytes(
+			ord(self.__printer.inst_list[byte % 32][1]) for byte in range(256)
+		)
+		return [zoomed, actual]
 
-		if self.zoom == 1:
-			symb = self.__printer.inst_list[inst][1]
-		elif inst > 16:
-			symb = ":"
-		else:
-			symb = "."
+	def __paint_block(self, codes, code, address, size):
+		""" Set color code of all cells overlapping a given block of memory.
+		"""
+		zoom = self.zoom
+		first = max(0, address - self.pos) // zoom
+		last = min(len(codes), -(-(address + size - self.pos) // zoom))
 
-		# Return tuple containing our post-redered cell.
-		return symb, curses.color_pair(pair)
+		if size and first < last:
+			codes[first:last] = bytes([code]) * (last - first)
 
 	def __get_max_zoom(self):
 		""" Calculate maximum needed zoom so that the entire world fits on the
 		terminal window.
 		"""
-		max_zoom = 1
 		line_size = self.__printer.size[1] - self.PADDING
 		coverage = self.__printer.size[0] * line_size
 
 		# We fix a maximum zoom level; otherwise, program may halt on extreme
 		# zoom levels.
-		while (
-			(coverage * max_zoom) < self.__sim.lib.sal_mem_get_size() and
-			max_zoom < 2 ** 16
-		):
-			max_zoom *= 2
+		if coverage <= 0:
+			return 2 ** 16
 
-		return max_zoom
+		# Zoom is the smallest power of two at which coverage reaches the
+		# memory size.
+		needed = -(-self.__sim.lib.sal_mem_get_size() // coverage)
+		return min(1 << (needed - 1).bit_length(), 2 ** 16)
 
 	def __is_world_editable(self):
 		""" For this to return True, printer's current page must be WORLD page.
@@ -24,6 +24,7 @@ $ ./bin/plugins/fireup.py -a 0x100000 -f 20.01.sim 20.02.sim 20.03.sim
 import argparse
 import os
 import subprocess
+import sys
 
 
 # Parse CLI arguments with the argparse module. Required arguments are the
@@ -61,15 +62,34 @@ if len(args.files) != len(set(args.files)):
 # Everything seems OK! Let's fire up the TMUX sessions, one for every saved
 # file. Tmux sessions will be named similarly to their contained simulations.
 # We can, at any time, re-attach to any running session, or make use of all
-# other tmux commands.
+# other tmux commands. Session creation and key sending get chained into a
+# single tmux invocation (';' separates tmux commands). All invocations are
+# launched at once, and we wait for them to finish afterwards.
 print("Firing up Salis simulations.")
+launches = []
 
 for fname in args.files:
 	session = "salis-{}".format(fname).replace(".", "-")
 	salis_cmd = "{} -m -r load -f {} -a {}".format(salis, fname, args.auto)
-	subprocess.run(["tmux", "new-session", "-d", "-s", session])
-	subprocess.run(["tmux", "send-keys", "-t", session, salis_cmd])
-	subprocess.run(["tmux", "send-keys", "-t", session, "Enter"])
-	print("New tmux session '{}' is running '{}' in the background.".format(
-		session, fname
-	))
+	launches.append((session, fname, subprocess.Popen([
+		"tmux", "new-session", "-d", "-s", session, ";",
+		"send-keys", "-t", session, salis_cmd, "Enter",
+	])))
+
+# Report every session, but exit with an error if any of them failed to start
+# (e.g. a session with the same name already exists).
+failed = False
+
+for session, fname, proc in launches:
+	if proc.wait():
+		failed = True
+		print("Failed to start tmux session '{}' for '{}'.".format(
+			session, fname
+		), file=sys.stderr)
+	else:
+		print("New tmux session '{}' is running '{}' in the background.".format(
+			session, fname
+		))
+
+if failed:
+	sys.exit(1)
@@ -34,6 +34,9 @@ __version__ = "2.0"
 
 
 class Salis:
+	FRAME_BURSTS = 16
+	API_PATTERN = re.compile(r"SALIS_API\s+(\w+)\s+(\w+)\s*\(([^)]*)\)\s*;")
+
 	def __init__(self):
 		""" Salis constructor. Arguments are passed through the command line
 		and parsed with the 'argparse' module. Library is loaded with 'CDLL'
@@ -48,7 +51,9 @@ class Salis:
 		# Now we can declare all other public and private members.
 		self.__log = self.__open_log_file()
 		self.__exit = False
+		self.__burst_size = 1
 		self.save_file_path = self.__get_save_file_path()
+		self.save_file_path_b = self.save_file_path.encode("utf-8")
 		self.lib = self.__parse_lib()
 		self.common = Common(self)
 		self.printer = Printer(self)
@@ -66,12 +71,9 @@ class Salis:
 		if self.args.action == "new":
 			self.lib.sal_main_init(self.args.order)
 		elif self.args.action == "load":
-			self.lib.sal_main_load(self.save_file_path.encode("utf-8"))
-
-		# Configure Common module. Pass C callbacks to Salis and load settings
-		# for this simulator (if they exist).
-		self.common.define_functors()
+			self.lib.sal_main_load(self.save_file_path_b)
 
+		# Load Common module settings for this simulator (if they exist).
 		try:
 			self.common.load_network_config(self.args.file + ".json")
 		except FileNotFoundError:
@@ -96,14 +98,26 @@ class Salis:
 		):
 			os.remove(self.__log)
 
-	def cycle(self):
+	def cycle(self, count=1):
 		""" Perform all cycle operations. These include cycling the actual
-		Salis simulator, checking for autosave intervals and cycling the Common
-		module.
+		Salis simulator, cycling the Common module and checking for autosave
+		intervals. The Common module gets cycled right after Salis, so that
+		its buffers reflect what organisms sent and received. Salis may be
+		cycled up to 'count' times in a single call, but never past the next
+		autosave interval. At least one cycle always gets performed, so that
+		callers looping on the returned amount keep making progress. Returns
+		the amount of cycles performed.
 		"""
+		if self.autosave != "---":
+			cycle = self.lib.sal_main_get_cycle()
+			count = min(count, self.autosave - (cycle % self.autosave))
+
+		count = max(1, count)
+
+		self.lib.sal_main_cycle_n(count)
 		self.common.cycle()
-		self.lib.sal_main_cycle()
 		self.check_autosave()
+		return count
 
 	def run(self):
 		""" Runs main simulation loop. Curses may be placed on non-blocking
@@ -115,12 +129,21 @@ class Salis:
 			self.handler.process_cmd(self.printer.get_cmd())
 
 			# If in non-blocking mode, re-print data once every 15
-			# milliseconds.
+			# milliseconds. The frame interval is measured on the monotonic
+			# clock, so that changes to the system time can't stall the
+			# display or skip frames.
 			if self.state == "running":
-				end = time.time() + 0.015
+				end = time.monotonic() + 0.015
+				cycles = 0
 
-				while time.time() < end:
-					self.cycle()
+				while time.monotonic() < end:
+					cycles += self.cycle(self.__burst_size)
+
+				# Salis gets cycled in bursts, sized so that roughly
+				# 'FRAME_BURSTS' of them fit in a frame. This keeps the
+				# deadline responsive while avoiding library and clock calls
+				# on every single cycle.
+				self.__burst_size = max(1, cycles // self.FRAME_BURSTS)
 
 	def toggle_state(self):
 		""" Toggle between 'paused' and 'running' states. On 'running' curses
@@ -134,15 +157,23 @@ class Salis:
 			self.printer.set_nodelay(False)
 
 	def rename(self, new_name):
-		""" Give the simulation a new name.
+		""" Give the simulation a new name. The encoded save file path, which
+		gets passed along to Salis, must be updated as well.
 		"""
 		self.args.file = new_name
 		self.save_file_path = self.__get_save_file_path()
+		self.save_file_path_b = self.save_file_path.encode("utf-8")
 
 	def set_autosave(self, interval):
 		""" Set the simulation's auto-save interval. When set to zero, auto
-		saving is disabled,
+		saving is disabled. Intervals must lie between 0 and (2**32 - 1).
 		"""
+		if interval not in range(2 ** 32):
+			raise ValueError(
+				"Auto-save interval must be an integer between 0 and "
+				"(2**32 - 1)"
+			)
+
 		if not interval:
 			self.autosave = "---"
 		else:
@@ -167,7 +198,7 @@ class Salis:
 				check_call(["gzip", auto_path])
 
 				# Save to main file as well.
-				self.lib.sal_main_save(self.save_file_path.encode("utf-8"))
+				self.lib.sal_main_save(self.save_file_path_b)
 
 	def exit(self):
 		""" Save network settings and signal we want to exit the simulator.
@@ -279,6 +310,13 @@ class Salis:
 					"Save file provided '{}' does not exist".format(savefile)
 				)
 
+		# Auto-save intervals must fit on a 32 bit unsigned integer.
+		if args.auto is not None and args.auto not in range(2 ** 32):
+			parser.error(
+				"Auto-save interval must be an integer between 0 and "
+				"(2**32 - 1)"
+			)
+
 		# Set autosave interval, if given.
 		#if args.auto:
 		if args.auto:
@@ -327,19 +365,11 @@ class Salis:
 
 			# Regexp to detect C functions to parse. This is a *very lazy*
 			# parser. So, if you want to expand/tweak Salis, be careful when
-			# declaring new functions!
-			funcs = re.findall(r"SALIS_API([\s\S]+?);", text, re.MULTILINE)
-
-			for func in funcs:
-				func = func.replace("\n", "")
-				func = func.replace("\t", "")
-				func = func.strip()
-				restype = func.split()[0]
-				name = func.split()[1].split("(")[0]
-				args = [
-					arg.split()[0]
-					for arg in func.split("(")[1].split(")")[0].split(",")
-				]
+			# declaring new functions! Each match yields the return type, name
+			# and argument list of a function, even if its declaration spans
+			# multiple lines.
+			for restype, name, arg_list in self.API_PATTERN.findall(text):
+				args = [arg.split()[0] for arg in arg_list.split(",")]
 				funcs_to_set.append({
 					"name": name,
 					"restype": restype,
@@ -362,12 +392,14 @@ class Salis:
 		}
 
 		# Finally, set correct arguments and return types of all Salis
-		# functions.
+		# functions. Functions declared with a '(void)' argument list take no
+		# arguments at all.
 		for func in funcs_to_set:
-			func["restype"] = type_convert[func["restype"]]
-			func["args"] = [type_convert[arg] for arg in func["args"]]
-			getattr(lib, func["name"]).restype = func["restype"]
-			getattr(lib, func["name"]).argtype = func["args"]
+			c_func = getattr(lib, func["name"])
+			c_func.restype = type_convert[func["restype"]]
+			c_func.argtypes = [
+				type_convert[arg] for arg in func["args"] if arg != "void"
+			]
 
 		return lib
 
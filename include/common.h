@@ -12,6 +12,8 @@
 #ifndef SALIS_COMMON_H
 #define SALIS_COMMON_H
 
+#define COMM_BUFFER_SIZE 0x1000
+
 /**
 * Typedef sender functor type for easy python parsing.
 */
@@ -23,22 +25,55 @@ typedef void (*Sender)(uint8 inst);
 typedef uint8 (*Receiver)(void);
 
 /**
-* Set sender functor. When unset, SEND instruction does nothing.
+* Set sender functor. When unset, SEND instruction pushes into the common
+* output buffer.
 * @param sender Sender functor
 */
 SALIS_API void sal_comm_set_sender(Sender sender);
 
 /**
-* Set receiver functor. When unset, RCVE instruction does nothing.
+* Set receiver functor. When unset, RCVE instruction pops from the common
+* input buffer.
 * @param receiver Receiver functor
 */
 SALIS_API void sal_comm_set_receiver(Receiver receiver);
 
+/**
+* Get amount of instructions waiting on the common input buffer.
+* @return Amount of instructions on the input buffer
+*/
+SALIS_API uint32 sal_comm_get_in_count(void);
+
+/**
+* Get amount of instructions waiting on the common output buffer.
+* @return Amount of instructions on the output buffer
+*/
+SALIS_API uint32 sal_comm_get_out_count(void);
+
+/**
+* Push instructions into the common input buffer, from which processes
+* receive whenever the receiver functor is unset.
+* @param buffer Buffer containing the instructions to push
+* @param size Amount of instructions on buffer
+* @return Amount of instructions pushed (input buffer may fill up)
+*/
+SALIS_API uint32 sal_comm_fill_in(uint8_p buffer, uint32 size);
+
+/**
+* Pop instructions from the common output buffer, into which processes send
+* whenever the sender functor is unset.
+* @param buffer Pre-allocated buffer to store the instructions on
+* @param size Maximum amount of instructions to pop
+* @return Amount of instructions popped
+*/
+SALIS_API uint32 sal_comm_drain_out(uint8_p buffer, uint32 size);
+
 
 /*******************************
 * PRIVATES                     *
 *******************************/
 
+void _sal_comm_quit(void);
 void _sal_comm_send(uint8 inst);
 uint8 _sal_comm_receive(void);
 
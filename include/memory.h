@@ -44,6 +44,12 @@ SALIS_API uint32 sal_mem_get_capacity(void);
 */
 SALIS_API uint32 sal_mem_get_inst_count(uint8 inst);
 
+/**
+* Get a copy of the amount of addresses holding each instruction.
+* @param buffer Pre-allocated buffer to store counts on [INST_COUNT]
+*/
+SALIS_API void sal_mem_get_inst_counts(uint32_p buffer);
+
 /**
 * Determine if memory is above its capacity.
 * @return Memory is above capacity
@@ -64,6 +70,14 @@ SALIS_API boolean sal_mem_is_address_valid(uint32 address);
 */
 SALIS_API boolean sal_mem_is_allocated(uint32 address);
 
+/**
+* Find first address with the allocated flag set inside a memory block.
+* @param address Starting address of the block (block must be valid)
+* @param size Size of the block being queried
+* @return First allocated address on block (UINT32_MAX if block is free)
+*/
+SALIS_API uint32 sal_mem_find_allocated(uint32 address, uint32 size);
+
 /**
 * Get current instruction at address.
 * @param address Address being queried
@@ -71,6 +85,16 @@ SALIS_API boolean sal_mem_is_allocated(uint32 address);
 */
 SALIS_API uint8 sal_mem_get_inst(uint32 address);
 
+/**
+* Get all instructions currently written on a memory block.
+* @param address Starting address of the block (block must be valid)
+* @param buffer Pre-allocated buffer to store the instructions into
+* @param size Amount of instructions to retrieve
+*/
+SALIS_API void sal_mem_get_inst_block(
+	uint32 address, uint8_p buffer, uint32 size
+);
+
 /**
 * Write instruction into address.
 * @param address Address being set
@@ -78,6 +102,16 @@ SALIS_API uint8 sal_mem_get_inst(uint32 address);
 */
 SALIS_API void sal_mem_set_inst(uint32 address, uint8 inst);
 
+/**
+* Write a string of instructions into a memory block.
+* @param address Starting address of the block (block must be valid)
+* @param insts Instructions to write into the block
+* @param size Amount of instructions to write
+*/
+SALIS_API void sal_mem_set_inst_block(
+	uint32 address, uint8_p insts, uint32 size
+);
+
 /**
 * Get current byte at address.
 * @param address Address being queried
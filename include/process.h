@@ -77,6 +77,23 @@ SALIS_API Process sal_proc_get_proc(uint32 proc_id);
 */
 SALIS_API void sal_proc_get_proc_data(uint32 proc_id, uint32_p buffer);
 
+/**
+* Get data of a contiguous range of processes.
+* @param first ID of first Process being queried
+* @param count Amount of processes being queried (range must be valid)
+* @param buffer Pre-allocated buffer to store data on [count * sizeof(Process)]
+*/
+SALIS_API void sal_proc_get_proc_data_block(
+	uint32 first, uint32 count, uint32_p buffer
+);
+
+/**
+* Get ID of the living process that owns a given address.
+* @param address Address to look up
+* @return Process ID, or UINT32_MAX if address is not owned by any process
+*/
+SALIS_API uint32 sal_proc_get_owner_of(uint32 address);
+
 /**
 * Create new process.
 * @param address Address we want to allocate our process into
@@ -66,6 +66,12 @@ SALIS_API uint32 sal_main_get_epoch(void);
 */
 SALIS_API void sal_main_cycle(void);
 
+/**
+* Update simulation a given number of times, in a single call.
+* @param count Amount of cycles to update simulation
+*/
+SALIS_API void sal_main_cycle_n(uint32 count);
+
 #ifdef __cplusplus
 	}
 #endif
@@ -1,16 +1,35 @@
 #include <assert.h>
+#include <string.h>
 #include "types.h"
 #include "instset.h"
 #include "common.h"
 
+/*
+* Common input and output buffers are circular queues of instructions. They
+* are used whenever the sender or receiver functors are unset, so that wrapper
+* applications may exchange instructions with Salis in bulk, instead of once
+* per executed SEND or RCVE instruction.
+*/
+struct Buffer
+{
+	uint8 insts[COMM_BUFFER_SIZE];
+	uint32 first;
+	uint32 count;
+};
+
+typedef struct Buffer Buffer;
+
 static Sender g_sender;
 static Receiver g_receiver;
+static Buffer g_in_buffer;
+static Buffer g_out_buffer;
 
 void sal_comm_set_sender(Sender sender)
 {
 	/*
 	* Set sender functor. Whenever an organism calls the SEND instruction,
-	* this function will get called. When unset, SEND instruction is ignored.
+	* this function will get called. When unset, SEND instruction pushes into
+	* the common output buffer.
 	*/
 	assert(sender);
 	g_sender = sender;
@@ -20,22 +39,128 @@ void sal_comm_set_receiver(Receiver receiver)
 {
 	/*
 	* Set receiver functor. Whenever an organism calls the RCVE instruction,
-	* this function will get called. When unset, RCVE instruction is ignored.
+	* this function will get called. When unset, RCVE instruction pops from
+	* the common input buffer.
 	*/
 	assert(receiver);
 	g_receiver = receiver;
 }
 
+static boolean buffer_push(Buffer *buffer, uint8 inst)
+{
+	/*
+	* Push a single instruction at the back of a buffer. Returns FALSE if the
+	* buffer is full.
+	*/
+	assert(buffer);
+	assert(sal_is_inst(inst));
+
+	if (buffer->count == COMM_BUFFER_SIZE) {
+		return FALSE;
+	}
+
+	buffer->insts[(buffer->first + buffer->count) % COMM_BUFFER_SIZE] = inst;
+	buffer->count++;
+	return TRUE;
+}
+
+static boolean buffer_pop(Buffer *buffer, uint8_p inst)
+{
+	/*
+	* Pop a single instruction from the front of a buffer. Returns FALSE if
+	* the buffer is empty.
+	*/
+	assert(buffer);
+	assert(inst);
+
+	if (!buffer->count) {
+		return FALSE;
+	}
+
+	*inst = buffer->insts[buffer->first];
+	buffer->first = (buffer->first + 1) % COMM_BUFFER_SIZE;
+	buffer->count--;
+	return TRUE;
+}
+
+uint32 sal_comm_get_in_count(void)
+{
+	/*
+	* Get amount of instructions waiting on the common input buffer.
+	*/
+	return g_in_buffer.count;
+}
+
+uint32 sal_comm_get_out_count(void)
+{
+	/*
+	* Get amount of instructions waiting on the common output buffer.
+	*/
+	return g_out_buffer.count;
+}
+
+uint32 sal_comm_fill_in(uint8_p buffer, uint32 size)
+{
+	/*
+	* Push a string of instructions into the common input buffer. We stop
+	* whenever the input buffer fills up, and return the amount of
+	* instructions that got pushed.
+	*/
+	uint32 i;
+	assert(buffer);
+
+	for (i = 0; i < size; i++) {
+		if (!buffer_push(&g_in_buffer, buffer[i])) {
+			break;
+		}
+	}
+
+	return i;
+}
+
+uint32 sal_comm_drain_out(uint8_p buffer, uint32 size)
+{
+	/*
+	* Pop up to 'size' instructions from the common output buffer and write
+	* them into a pre-allocated buffer. Returns the amount of instructions
+	* that got written.
+	*/
+	uint32 i;
+	assert(buffer);
+
+	for (i = 0; i < size; i++) {
+		if (!buffer_pop(&g_out_buffer, &buffer[i])) {
+			break;
+		}
+	}
+
+	return i;
+}
+
+void _sal_comm_quit(void)
+{
+	/*
+	* Reset common buffers back to zero. Any instructions still on them get
+	* discarded.
+	*/
+	memset(&g_in_buffer, 0, sizeof(Buffer));
+	memset(&g_out_buffer, 0, sizeof(Buffer));
+}
+
 void _sal_comm_send(uint8 inst)
 {
 	/*
 	* Send a single byte (instruction) to the sender. This function is called
-	* by processes that execute the SEND instruction.
+	* by processes that execute the SEND instruction. If sender is unset, the
+	* instruction gets pushed into the output buffer (or discarded, if the
+	* buffer is full).
 	*/
 	assert(sal_is_inst(inst));
 
 	if (g_sender) {
 		g_sender(inst);
+	} else {
+		buffer_push(&g_out_buffer, inst);
 	}
 }
 
@@ -43,14 +168,18 @@ uint8 _sal_comm_receive(void)
 {
 	/*
 	* Receive a single byte (instruction) from the receiver. This function is
-	* called by processes that execute the RCVE instruction. It returns NOP0 is
-	* receiver is unset.
+	* called by processes that execute the RCVE instruction. If receiver is
+	* unset, the instruction gets popped from the input buffer. It returns
+	* NOP0 if there's nothing to receive.
 	*/
+	uint8 inst = NOP0;
+
 	if (g_receiver) {
-		uint8 inst = g_receiver();
-		assert(sal_is_inst(inst));
-		return inst;
+		inst = g_receiver();
 	} else {
-		return NOP0;
+		buffer_pop(&g_in_buffer, &inst);
 	}
+
+	assert(sal_is_inst(inst));
+	return inst;
 }
@@ -103,6 +103,19 @@ uint32 sal_mem_get_inst_count(uint8 inst)
 	return g_inst_counter[inst];
 }
 
+void sal_mem_get_inst_counts(uint32_p buffer)
+{
+	/*
+	* Get a **copy** of the whole instruction counter, written into the given
+	* buffer. This allows wrapper applications to retrieve all counts with a
+	* single call. The buffer must be pre-allocated to a large enough size
+	* (i.e. malloc(sizeof(uint32) * INST_COUNT)).
+	*/
+	assert(g_is_init);
+	assert(buffer);
+	memcpy(buffer, g_inst_counter, sizeof(uint32) * INST_COUNT);
+}
+
 boolean sal_mem_is_over_capacity(void)
 {
 	/*
@@ -132,6 +145,28 @@ boolean sal_mem_is_allocated(uint32 address)
 	return !!(g_memory[address] & ALLOCATED_FLAG);
 }
 
+uint32 sal_mem_find_allocated(uint32 address, uint32 size)
+{
+	/*
+	* Find the first address inside a given memory block that has the
+	* allocated flag set. Return UINT32_MAX (which Salis uses to represent
+	* NULL) if the entire block is free. The block must lie within memory
+	* bounds.
+	*/
+	uint32 offset;
+	assert(g_is_init);
+	assert(sal_mem_is_address_valid(address));
+	assert(size <= g_size - address);
+
+	for (offset = 0; offset < size; offset++) {
+		if (g_memory[address + offset] & ALLOCATED_FLAG) {
+			return address + offset;
+		}
+	}
+
+	return UINT32_MAX;
+}
+
 void _sal_mem_set_allocated(uint32 address)
 {
 	/*
@@ -171,6 +206,25 @@ uint8 sal_mem_get_inst(uint32 address)
 	return g_memory[address] & INSTRUCTION_MASK;
 }
 
+void sal_mem_get_inst_block(uint32 address, uint8_p buffer, uint32 size)
+{
+	/*
+	* Copy all instructions inside a memory block into a pre-allocated
+	* buffer, with the allocated bit flags turned off. This allows wrapper
+	* applications to retrieve whole genomes with a single call. The block
+	* must lie within memory bounds.
+	*/
+	uint32 offset;
+	assert(g_is_init);
+	assert(buffer);
+	assert(sal_mem_is_address_valid(address));
+	assert(size <= g_size - address);
+
+	for (offset = 0; offset < size; offset++) {
+		buffer[offset] = g_memory[address + offset] & INSTRUCTION_MASK;
+	}
+}
+
 void sal_mem_set_inst(uint32 address, uint8 inst)
 {
 	/*
@@ -186,6 +240,24 @@ void sal_mem_set_inst(uint32 address, uint8 inst)
 	g_inst_counter[inst]++;
 }
 
+void sal_mem_set_inst_block(uint32 address, uint8_p insts, uint32 size)
+{
+	/*
+	* Write a string of instructions into a memory block, starting at given
+	* address. This allows compiling whole genomes with a single call. The
+	* block must lie within memory bounds.
+	*/
+	uint32 offset;
+	assert(g_is_init);
+	assert(insts);
+	assert(sal_mem_is_address_valid(address));
+	assert(size <= g_size - address);
+
+	for (offset = 0; offset < size; offset++) {
+		sal_mem_set_inst(address + offset, insts[offset]);
+	}
+}
+
 uint8 sal_mem_get_byte(uint32 address)
 {
 	/*
@@ -144,6 +144,66 @@ void sal_proc_get_proc_data(uint32 proc_id, uint32_p buffer)
 	memcpy(buffer, &g_procs[proc_id], sizeof(Process));
 }
 
+void sal_proc_get_proc_data_block(uint32 first, uint32 count, uint32_p buffer)
+{
+	/*
+	* Get a **copy** of a contiguous range of processes, starting at the given
+	* ID, written into the given buffer. This allows wrapper applications to
+	* retrieve a whole table of processes with a single call. The buffer must
+	* be pre-allocated to a large enough size (i.e.
+	* malloc(count * sizeof(Process))).
+	*/
+	assert(g_is_init);
+	assert(first < g_capacity);
+	assert(count <= g_capacity - first);
+	assert(buffer);
+	memcpy(buffer, &g_procs[first], count * sizeof(Process));
+}
+
+uint32 sal_proc_get_owner_of(uint32 address)
+{
+	/*
+	* Find the living process that owns the given address, if any. Memory
+	* blocks never overlap, so at most one process may own it. Return
+	* UINT32_MAX (NULL) when address is not allocated by any process.
+	*/
+	uint32 pidx;
+
+	assert(g_is_init);
+	assert(sal_mem_is_address_valid(address));
+
+	if (!g_count || !sal_mem_is_allocated(address)) {
+		return UINT32_MAX;
+	}
+
+	/*
+	* Only iterate living processes, by walking the reaper queue from its
+	* bottom ('g_first') to its top ('g_last').
+	*/
+	pidx = g_first;
+
+	while (TRUE) {
+		uint32 lo1 = g_procs[pidx].mb1a;
+		uint32 lo2 = g_procs[pidx].mb2a;
+		uint32 hi1 = lo1 + g_procs[pidx].mb1s;
+		uint32 hi2 = lo2 + g_procs[pidx].mb2s;
+
+		if (
+			(address >= lo1 && address < hi1) ||
+			(address >= lo2 && address < hi2)
+		) {
+			return pidx;
+		}
+
+		if (pidx == g_last) {
+			return UINT32_MAX;
+		}
+
+		pidx++;
+		pidx %= g_capacity;
+	}
+}
+
 static boolean block_is_free_and_valid(uint32 address, uint32 size)
 {
 	/*
@@ -32,6 +32,7 @@ void sal_main_quit(void)
 	_sal_proc_quit();
 	_sal_evo_quit();
 	_sal_mem_quit();
+	_sal_comm_quit();
 	g_is_init = FALSE;
 	g_cycle = 0;
 	g_epoch = 0;
@@ -112,3 +113,17 @@ void sal_main_cycle(void)
 	_sal_evo_cycle();
 	_sal_proc_cycle();
 }
+
+void sal_main_cycle_n(uint32 count)
+{
+	/*
+	* Cycle the Salis simulator 'count' number of times. This saves wrapper
+	* applications from having to call 'sal_main_cycle' once per cycle.
+	*/
+	uint32 i;
+	assert(g_is_init);
+
+	for (i = 0; i < count; i++) {
+		sal_main_cycle();
+	}
+}
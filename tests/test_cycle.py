@@ -0,0 +1,109 @@
+""" SALIS: Viewer/controller for the SALIS simulator.
+
+File: test_cycle.py
+
+Tests for burst cycling on the Salis class. The Salis library gets replaced by
+a small stand-in that only keeps track of the simulation cycle, so these tests
+can run without building the C library or opening a curses screen. To run:
+
+$ python3 -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../bin"))
+
+from salis import Salis
+
+
+class FakeLib:
+	def __init__(self, cycle=0):
+		self.cycle = cycle
+		self.bursts = []
+
+	def sal_main_get_cycle(self):
+		return self.cycle
+
+	def sal_main_cycle_n(self, count):
+		self.bursts.append(count)
+		self.cycle += count
+
+
+class FakeCommon:
+	def cycle(self):
+		pass
+
+
+class TestCycle(unittest.TestCase):
+	def get_sim(self, cycle=0, autosave=0):
+		""" Build a Salis object without running its constructor, linked to a
+		stand-in library starting at the given cycle.
+		"""
+		sim = Salis.__new__(Salis)
+		sim.autosave = "---"
+		sim.lib = FakeLib(cycle)
+		sim.common = FakeCommon()
+		sim.check_autosave = lambda: None
+		sim.set_autosave(autosave)
+		return sim
+
+	def test_no_autosave(self):
+		sim = self.get_sim(cycle=10)
+		self.assertEqual(sim.cycle(100), 100)
+		self.assertEqual(sim.lib.bursts, [100])
+
+	def test_stops_on_autosave_boundary(self):
+		sim = self.get_sim(cycle=10, autosave=16)
+		self.assertEqual(sim.cycle(100), 6)
+		self.assertEqual(sim.lib.cycle, 16)
+
+	def test_full_interval_from_boundary(self):
+		sim = self.get_sim(cycle=16, autosave=16)
+		self.assertEqual(sim.cycle(100), 16)
+		self.assertEqual(sim.cycle(5), 5)
+		self.assertEqual(sim.lib.bursts, [16, 5])
+
+	def test_interval_of_one(self):
+		sim = self.get_sim(cycle=3, autosave=1)
+		self.assertEqual(sim.cycle(100), 1)
+
+	def test_never_cycles_less_than_once(self):
+		sim = self.get_sim()
+		self.assertEqual(sim.cycle(0), 1)
+		self.assertEqual(sim.cycle(-5), 1)
+		self.assertEqual(sim.lib.bursts, [1, 1])
+
+	def test_zero_disables_autosave(self):
+		sim = self.get_sim(autosave=16)
+		sim.set_autosave(0)
+		self.assertEqual(sim.autosave, "---")
+		self.assertEqual(sim.cycle(100), 100)
+
+	def test_rejects_out_of_range_autosave(self):
+		sim = self.get_sim(autosave=16)
+
+		for interval in (-1, -16, 2 ** 32):
+			with self.assertRaises(ValueError):
+				sim.set_autosave(interval)
+
+		self.assertEqual(sim.autosave, 16)
+
+	def test_bursts_add_up_to_factor(self):
+		sim = self.get_sim(cycle=7, autosave=32)
+		factor = 512
+
+		while factor > 0:
+			start = sim.lib.cycle
+			factor -= sim.cycle(min(factor, 100))
+
+			# No burst may run past an autosave boundary.
+			self.assertLessEqual(sim.lib.cycle, (start // 32 + 1) * 32)
+
+		self.assertEqual(factor, 0)
+		self.assertEqual(sim.lib.cycle, 7 + 512)
+
+
+if __name__ == "__main__":
+	unittest.main()